@@ -107,16 +107,24 @@ class ConfigurationManager:
     def __init__(self, db_path):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
+        # WAL + NORMAL sync avoids a full fsync on every config save
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
         self.create_tables()
         self.load_configs()
 
     def create_tables(self):
         c = self.conn.cursor()
         
-        # Component default configurations
-        c.execute('''
+        # Create both tables in one script; the BEGIN keeps schema setup and
+        # default seeding below in one transaction (single commit)
+        c.executescript('''
+            BEGIN;
+            
+            -- Component default configurations
             CREATE TABLE IF NOT EXISTS ComponentConfigs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 component_type TEXT NOT NULL,
                 parameter_name TEXT NOT NULL,
                 default_value REAL NOT NULL,
@@ -125,61 +133,63 @@ class ConfigurationManager:
                 description TEXT,
                 units TEXT,
                 UNIQUE(component_type, parameter_name)
-            )
-        ''')
-        
-        # User-defined configurations
-        c.execute('''
+            );
+            
+            -- User-defined configurations
             CREATE TABLE IF NOT EXISTS UserConfigs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 component_type TEXT NOT NULL,
                 parameter_name TEXT NOT NULL,
                 value REAL NOT NULL,
                 last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 UNIQUE(component_type, parameter_name)
-            )
+            );
         ''')
         
-        # Populate default configurations if table is empty
-        c.execute('SELECT COUNT(*) FROM ComponentConfigs')
-        if c.fetchone()[0] == 0:
-            for comp_type, params in DEFAULT_CONFIGS.items():
-                for param_name, param_data in params.items():
-                    c.execute('''
-                        INSERT INTO ComponentConfigs 
-                        (component_type, parameter_name, default_value, min_value, max_value, description, units)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        comp_type,
-                        param_name,
-                        param_data['default'],
-                        param_data['min'],
-                        param_data['max'],
-                        param_data['description'],
-                        param_data['units']
-                    ))
+        # Populate only the default configurations that aren't stored yet
+        existing = set(c.execute('SELECT component_type, parameter_name FROM ComponentConfigs'))
+        missing = [
+            (
+                comp_type,
+                param_name,
+                param_data['default'],
+                param_data['min'],
+                param_data['max'],
+                param_data['description'],
+                param_data['units']
+            )
+            for comp_type, params in DEFAULT_CONFIGS.items()
+            for param_name, param_data in params.items()
+            if (comp_type, param_name) not in existing
+        ]
+        if missing:
+            c.executemany('''
+                INSERT INTO ComponentConfigs 
+                (component_type, parameter_name, default_value, min_value, max_value, description, units)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', missing)
         
         self.conn.commit()
 
     def load_configs(self):
         """Load configurations from database, falling back to defaults if not found"""
         self.current_configs = {}
-        c = self.conn.cursor()
-        
+
+        # Fetch all user configs in one query instead of one query per parameter,
+        # streaming rows from the cursor rather than materializing a fetchall() list
+        user_configs = {
+            (component_type, param_name): value
+            for component_type, param_name, value in self.conn.execute(
+                'SELECT component_type, parameter_name, value FROM UserConfigs'
+            )
+        }
+
         for component_type, params in DEFAULT_CONFIGS.items():
             self.current_configs[component_type] = {}
             for param_name, param_data in params.items():
-                # Try to get user config
-                c.execute('''
-                    SELECT value FROM UserConfigs 
-                    WHERE component_type = ? AND parameter_name = ?
-                ''', (component_type, param_name))
-                result = c.fetchone()
-                
-                if result:
-                    self.current_configs[component_type][param_name] = result[0]
-                else:
-                    self.current_configs[component_type][param_name] = param_data['default']
+                self.current_configs[component_type][param_name] = user_configs.get(
+                    (component_type, param_name), param_data['default']
+                )
 
     def save_config(self, component_type, parameter_name, value):
         """Save user configuration to database"""
@@ -188,37 +198,46 @@ class ConfigurationManager:
         if value < param_data['min'] or value > param_data['max']:
             return False, f"Value must be between {param_data['min']} and {param_data['max']} {param_data['units']}"
         
-        c = self.conn.cursor()
         try:
-            c.execute('''
-                INSERT OR REPLACE INTO UserConfigs (component_type, parameter_name, value)
-                VALUES (?, ?, ?)
-            ''', (component_type, parameter_name, value))
-            self.conn.commit()
-            self.load_configs()
+            # Commits on success, rolls back on error
+            with self.conn:
+                self.conn.execute('''
+                    INSERT INTO UserConfigs (component_type, parameter_name, value)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(component_type, parameter_name)
+                    DO UPDATE SET value = excluded.value, last_modified = CURRENT_TIMESTAMP
+                ''', (component_type, parameter_name, value))
+            # Keep the in-memory copy in sync without re-reading the table
+            self.current_configs[component_type][parameter_name] = value
             return True, "Configuration saved successfully"
-        except Exception as e:
+        except sqlite3.Error as e:
             return False, f"Error saving configuration: {str(e)}"
 
     def reset_to_default(self, component_type, parameter_name=None):
         """Reset specific or all parameters for a component type to defaults"""
-        c = self.conn.cursor()
-        if parameter_name:
-            c.execute('''
-                DELETE FROM UserConfigs 
-                WHERE component_type = ? AND parameter_name = ?
-            ''', (component_type, parameter_name))
-        else:
-            c.execute('DELETE FROM UserConfigs WHERE component_type = ?', (component_type,))
-        self.conn.commit()
-        self.load_configs()
+        with self.conn:
+            if parameter_name:
+                self.conn.execute('''
+                    DELETE FROM UserConfigs 
+                    WHERE component_type = ? AND parameter_name = ?
+                ''', (component_type, parameter_name))
+            else:
+                self.conn.execute('DELETE FROM UserConfigs WHERE component_type = ?', (component_type,))
+        
+        # Restore the defaults in memory without re-reading the table
+        params = DEFAULT_CONFIGS[component_type]
+        for param_name in ([parameter_name] if parameter_name else params):
+            self.current_configs[component_type][param_name] = params[param_name]['default']
 
     def reset_all_to_default(self):
         """Reset all configurations to their default values"""
-        c = self.conn.cursor()
-        c.execute('DELETE FROM UserConfigs')  # Remove all user configurations
-        self.conn.commit()
-        self.load_configs()
+        with self.conn:
+            self.conn.execute('DELETE FROM UserConfigs')  # Remove all user configurations
+        # No user configs remain, so rebuild from defaults without querying
+        self.current_configs = {
+            component_type: {param_name: param_data['default'] for param_name, param_data in params.items()}
+            for component_type, params in DEFAULT_CONFIGS.items()
+        }
         return "All configurations reset to default values"
 
 class ConfigurationScreen:
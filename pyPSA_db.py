@@ -129,6 +129,13 @@ DEFAULT_INDUCTIVE_PF = 0.8
 DEFAULT_CAPACITIVE_PF = 0.9
 DEFAULT_RESISTIVE_PF = 1.0
 
+# Sidebar component type -> consumer type lookup
+SIDEBAR_CONSUMER_TYPES = {
+    "INDUCTIVE_CONSUMER": CONSUMER_TYPE_INDUCTIVE,
+    "CAPACITIVE_CONSUMER": CONSUMER_TYPE_CAPACITIVE,
+    "RESISTIVE_CONSUMER": CONSUMER_TYPE_RESISTIVE
+}
+
 # --- Menu Settings ---
 MENU_HEIGHT = 40
 MENU_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, MENU_HEIGHT)
@@ -177,11 +184,20 @@ show_help = False
 connecting_consumer = None
 temp_connection_line_end = None
 log_messages = collections.deque(maxlen=MAX_LOG_MESSAGES)
+log_surface_cache = {}  # Rendered log text surfaces keyed by message
 log_font = None
+log_max_chars = SCREEN_WIDTH // 8 - 3  # Recomputed from log_font width once it is loaded
 entity_font = None
 menu_font = None
+menu_title_font = None
+button_font = None
+label_font = None
+body_font = None
+sidebar_title_font = None
 selected_grid_pos = None  # Store the currently selected grid position
 selected_component_type = None  # Store the currently selected component type
+pf_seed_buses = None  # Buses covered by the last power flow solution (warm start seed)
+network_dirty = True  # Set whenever the network changes and needs a new power flow
 
 # Add after the global variables section
 config_manager = None
@@ -211,8 +227,7 @@ class Button:
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect)
         if self.text:
-            font = pygame.font.SysFont("Arial", BUTTON_SIZE - 10)
-            text_surface = font.render(self.text, True, BUTTON_TEXT_COLOR)
+            text_surface = button_font.render(self.text, True, BUTTON_TEXT_COLOR)
             text_rect = text_surface.get_rect(center=self.rect.center)
             surface.blit(text_surface, text_rect)
     
@@ -225,8 +240,11 @@ class Button:
         return False
 
 def add_log_message(message):
-    max_len = SCREEN_WIDTH // (log_font.size("A")[0] if log_font and log_font.size("A")[0] > 0 else 8) - 3
+    max_len = log_max_chars
     log_messages.append(message[:max_len] + "..." if len(message) > max_len else message)
+    # Drop rendered surfaces for messages that scrolled out of the panel
+    for stale in log_surface_cache.keys() - set(log_messages):
+        del log_surface_cache[stale]
 
 def draw_outlined_text(surface, text, font, x, y, text_color, outline_color=BLACK):
     # Draw outline
@@ -262,6 +280,12 @@ class Entity(pygame.sprite.Sprite):
         # Create surface for the entity - match selection highlight size
         self.image = pygame.Surface((TILE_WIDTH * 2, TILE_WIDTH * 2), pygame.SRCALPHA)
         self.rect = self.image.get_rect()
+        
+        # Grid position is fixed, so compute the screen position once
+        iso_x, iso_y = to_isometric(self.grid_x, self.grid_y)
+        self.rect.topleft = (iso_x + MAIN_AREA_WIDTH // 2 - self.rect.width//2,
+                             iso_y + SCREEN_HEIGHT // 2 - self.rect.height//2)
+        self.shadow_surface = self.create_shadow()
         self.redraw()
 
     def redraw(self):
@@ -340,18 +364,12 @@ class Entity(pygame.sprite.Sprite):
             draw_dashed_line(self.image, edge_color, start, end, 1)
 
         # Add label
-        font = pygame.font.SysFont("Arial", 14, bold=True)
-        text_surface = font.render(self.label_text, True, WHITE)
+        text_surface = label_font.render(self.label_text, True, WHITE)
         text_rect = text_surface.get_rect(center=(center_x, center_y))
         self.image.blit(text_surface, text_rect)
 
-    def draw(self, surface):
-        # Calculate screen position using same conversion as selection highlight
-        iso_x, iso_y = to_isometric(self.grid_x, self.grid_y)
-        screen_x = iso_x + MAIN_AREA_WIDTH // 2 - self.rect.width//2
-        screen_y = iso_y + SCREEN_HEIGHT // 2 - self.rect.height//2
-        
-        # Draw shadow
+    def create_shadow(self):
+        """Build the drop shadow surface once - it only depends on the entity size"""
         shadow_points = [
             (self.rect.width//2, self.rect.height//2 + TILE_HEIGHT//2),
             (self.rect.width//2 + TILE_WIDTH//2, self.rect.height//2),
@@ -359,17 +377,19 @@ class Entity(pygame.sprite.Sprite):
             (self.rect.width//2 - TILE_WIDTH//2, self.rect.height//2)
         ]
         
-        # Create a surface for the shadow
         shadow_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
         pygame.draw.polygon(shadow_surface, (0, 0, 0, 40), shadow_points)
-        
+        return shadow_surface
+
+    def blit_items(self):
+        """Return (surface, position) pairs for the shadow and entity, for use with Surface.blits"""
+        screen_x, screen_y = self.rect.topleft
+        return [(self.shadow_surface, (screen_x + 2, screen_y + 2)),
+                (self.image, (screen_x, screen_y))]
+
+    def draw(self, surface):
         # Draw shadow and entity
-        surface.blit(shadow_surface, (screen_x + 2, screen_y + 2))
-        surface.blit(self.image, (screen_x, screen_y))
-        
-        # Update rect position for collision detection
-        self.rect.x = screen_x
-        self.rect.y = screen_y
+        surface.blits(self.blit_items(), doreturn=False)
 
     def update_status_color(self, new_color):
         if self.base_color != new_color:
@@ -415,8 +435,6 @@ class PowerSupplier(Entity):
             self.update_status_color(YELLOW)
         else:
             self.update_status_color(GREEN)
-        
-        self.redraw()
 
     def connect_consumer(self, consumer):
         if consumer not in self.connected_consumers:
@@ -462,11 +480,13 @@ class PowerConsumer(Entity):
         self.is_connected = False
 
     def connect(self, supplier):
+        global network_dirty
         if supplier is not None:
             self.connected_to = supplier
             self.is_connected = True
             supplier.connect_consumer(self)
             if network is not None:
+                network_dirty = True
                 try:
                     network.add("Line", f"line_{self.bus_name}",
                             bus0=supplier.bus_name,
@@ -476,8 +496,7 @@ class PowerConsumer(Entity):
                     # Update load in network
                     load_name = f"Load_{self.bus_name}"
                     if load_name in network.loads.index:
-                        network.loads.loc[load_name, "p_set"] = self.p_demand_rate
-                        network.loads.loc[load_name, "q_set"] = self.q_demand_rate
+                        network.loads.loc[load_name, ["p_set", "q_set"]] = [self.p_demand_rate, self.q_demand_rate]
                         if isinstance(network.loads_t.p_set, pd.DataFrame):
                             network.loads_t.p_set[load_name] = self.p_demand_rate
                             network.loads_t.q_set[load_name] = self.q_demand_rate
@@ -486,19 +505,20 @@ class PowerConsumer(Entity):
             add_log_message(f"Connected {self.label_text} (P={self.p_demand_rate:.1f}MW, Q={self.q_demand_rate:.1f}MVAr)")
 
     def disconnect(self):
+        global network_dirty
         if self.connected_to is not None:
             if self in self.connected_to.connected_consumers:
                 self.connected_to.connected_consumers.remove(self)
             self.connected_to = None
             self.is_connected = False
             if network is not None:
+                network_dirty = True
                 try:
                     network.remove("Line", f"line_{self.bus_name}")
                     # Reset load in network
                     load_name = f"Load_{self.bus_name}"
                     if load_name in network.loads.index:
-                        network.loads.loc[load_name, "p_set"] = 0
-                        network.loads.loc[load_name, "q_set"] = 0
+                        network.loads.loc[load_name, ["p_set", "q_set"]] = 0
                         if isinstance(network.loads_t.p_set, pd.DataFrame):
                             network.loads_t.p_set[load_name] = 0
                             network.loads_t.q_set[load_name] = 0
@@ -522,7 +542,6 @@ class PowerConsumer(Entity):
                 self.update_status_color(YELLOW)
             else:
                 self.update_status_color(GREEN)
-        self.redraw()
 
     def draw_connections(self, surface):
         if self.connected_to:
@@ -551,9 +570,11 @@ class PowerConsumer(Entity):
             pygame.draw.line(surface, line_color, start_pos, end_pos, CONNECTION_THICKNESS)
 
 def initialize_network():
-    global network
+    global network, pf_seed_buses, network_dirty
     try:
         network = pypsa.Network()
+        pf_seed_buses = None
+        network_dirty = True
         
         # Update time index to use 'h' instead of 'H'
         snapshots = pd.date_range('2024-01-01', periods=1, freq='h')
@@ -572,7 +593,7 @@ def initialize_network():
         add_log_message(f"Failed to initialize network: {str(e)}")
 
 def add_supplier_to_network(grid_x, grid_y):
-    global supplier_entity, network
+    global supplier_entity, network, network_dirty
     if supplier_entity is not None:
         add_log_message("Only one supplier allowed")
         return None
@@ -601,6 +622,8 @@ def add_supplier_to_network(grid_x, grid_y):
             v_set=1.0  # Per unit voltage setpoint
         )
     
+    network_dirty = True
+    
     # Create PyGame entity - pass grid coordinates directly
     supplier_entity = PowerSupplier(grid_x, grid_y, bus_name)
     pygame_entities.append(supplier_entity)
@@ -609,6 +632,7 @@ def add_supplier_to_network(grid_x, grid_y):
     return supplier_entity
 
 def add_consumer_to_network(grid_x, grid_y, consumer_type):
+    global network_dirty
     if network is None:
         add_log_message("Network not initialized")
         return None
@@ -636,26 +660,36 @@ def add_consumer_to_network(grid_x, grid_y, consumer_type):
         if isinstance(network.loads_t.p_set, pd.DataFrame):
             network.loads_t.p_set[load_name] = consumer.p_demand_rate
             network.loads_t.q_set[load_name] = consumer.q_demand_rate
+    network_dirty = True
     
     add_log_message(f"Consumer {len(network.loads)} added at bus {bus_name} (P: {consumer.p_demand_rate:.1f} MW, Q: {consumer.q_demand_rate:.1f} MVAr)")
     return consumer
 
 def update_network():
+    global pf_seed_buses, network_dirty
     try:
         if network is None:
             return
             
         if len(network.buses) > 0:  # Only run power flow if we have buses
-            # Ensure all loads have proper time series data
-            for load_name in network.loads.index:
+            # Power flow results only change when the network does
+            if network_dirty:
+                # Ensure all loads have proper time series data - backfill missing
+                # columns in one vectorized step instead of per-load .loc lookups
                 if isinstance(network.loads_t.p_set, pd.DataFrame):
-                    if load_name not in network.loads_t.p_set.columns:
-                        network.loads_t.p_set[load_name] = network.loads.loc[load_name, 'p_set']
-                    if load_name not in network.loads_t.q_set.columns:
-                        network.loads_t.q_set[load_name] = network.loads.loc[load_name, 'q_set']
-            
-            # Run power flow
-            network.pf()
+                    for attr in ("p_set", "q_set"):
+                        series = network.loads_t[attr]
+                        missing = network.loads.index.difference(series.columns)
+                        if len(missing) > 0:
+                            series[missing] = np.tile(network.loads.loc[missing, attr].values,
+                                                      (len(series.index), 1))
+                
+                # Run power flow, warm-starting Newton-Raphson from the previous
+                # solution when it covers exactly the current set of buses
+                use_seed = pf_seed_buses is not None and pf_seed_buses.equals(network.buses.index)
+                network.pf(use_seed=use_seed)
+                pf_seed_buses = network.buses.index.copy()
+                network_dirty = False
             
             # Update all entities with new power flow results
             for entity in pygame_entities:
@@ -679,13 +713,11 @@ def reset_simulation():
 
 def draw_menu(screen, menu_items, selected_index, mouse_pos=None):
     # Draw title
-    title_font = pygame.font.SysFont("Arial", MENU_TITLE_SIZE)
-    title_surface = title_font.render("Energy City Simulator", True, MENU_TITLE_COLOR)
+    title_surface = menu_title_font.render("Energy City Simulator", True, MENU_TITLE_COLOR)
     title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, MENU_START_Y - 100))
     screen.blit(title_surface, title_rect)
     
     # Draw menu items
-    menu_font = pygame.font.SysFont("Arial", MENU_ITEM_SIZE)
     for i, item in enumerate(menu_items):
         text_color = MENU_SELECTED_COLOR if i == selected_index else MENU_ITEM_COLOR
         text_surface = menu_font.render(item, True, text_color)
@@ -712,8 +744,22 @@ def draw_menu(screen, menu_items, selected_index, mouse_pos=None):
 # Modify the menu() function to include configuration option
 def menu():
     menu_items = ["Start Simulation", "Configure Components", "Exit"]
+    menu_actions = ["start", "configure", "exit"]  # Action returned for each menu item
     selected_index = 0
     
+    # Button positions, display surface and clock don't change between frames
+    button_rects = [
+        pygame.Rect(
+            (SCREEN_WIDTH - MENU_BUTTON_WIDTH) // 2,
+            MENU_START_Y + i * (MENU_BUTTON_HEIGHT + MENU_BUTTON_PADDING),
+            MENU_BUTTON_WIDTH,
+            MENU_BUTTON_HEIGHT
+        )
+        for i in range(len(menu_items))
+    ]
+    screen = pygame.display.get_surface()
+    clock = pygame.time.Clock()
+    
     while True:
         mouse_pos = pygame.mouse.get_pos()
         
@@ -722,21 +768,9 @@ def menu():
                 return "exit"
             
             if event.type == pygame.MOUSEBUTTONDOWN:
-                # Calculate button positions
-                for i in range(len(menu_items)):
-                    button_rect = pygame.Rect(
-                        (SCREEN_WIDTH - MENU_BUTTON_WIDTH) // 2,
-                        MENU_START_Y + i * (MENU_BUTTON_HEIGHT + MENU_BUTTON_PADDING),
-                        MENU_BUTTON_WIDTH,
-                        MENU_BUTTON_HEIGHT
-                    )
+                for i, button_rect in enumerate(button_rects):
                     if button_rect.collidepoint(mouse_pos):
-                        if i == 0:  # Start Simulation
-                            return "start"
-                        elif i == 1:  # Configure Components
-                            return "configure"
-                        else:  # Exit
-                            return "exit"
+                        return menu_actions[i]
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
@@ -744,20 +778,13 @@ def menu():
                 elif event.key == pygame.K_DOWN:
                     selected_index = (selected_index + 1) % len(menu_items)
                 elif event.key == pygame.K_RETURN:
-                    if selected_index == 0:
-                        return "start"
-                    elif selected_index == 1:
-                        return "configure"
-                    else:
-                        return "exit"
+                    return menu_actions[selected_index]
         
         # Draw menu
-        screen = pygame.display.get_surface()
         screen.fill(BLACK)
         draw_menu(screen, menu_items, selected_index, mouse_pos)
         pygame.display.flip()
         
-        clock = pygame.time.Clock()
         clock.tick(FPS)
 
 def show_help_screen():
@@ -766,14 +793,13 @@ def show_help_screen():
     help_surface.fill(HELP_BG)
     
     # Draw help text
-    font = pygame.font.SysFont("Arial", 16)
     y = 50
     for line in HELP_TEXT.split('\n'):
         if line.strip():  # Only render non-empty lines
             if line.endswith(':'):  # Section headers
-                text_surface = font.render(line, True, WHITE)
+                text_surface = body_font.render(line, True, WHITE)
             else:
-                text_surface = font.render(line, True, MENU_TEXT)
+                text_surface = body_font.render(line, True, MENU_TEXT)
             help_surface.blit(text_surface, (50, y))
         y += 25
     
@@ -802,7 +828,11 @@ def draw_log_panel(surface):
     for i, msg in enumerate(list(log_messages)):
         if start_y + i * line_height > LOG_PANEL_RECT.bottom - line_height:
             break
-        text_surface = log_font.render(msg, True, LOG_TEXT_COLOR)
+        # Render each message once and reuse the surface on later frames
+        text_surface = log_surface_cache.get(msg)
+        if text_surface is None:
+            text_surface = log_font.render(msg, True, LOG_TEXT_COLOR)
+            log_surface_cache[msg] = text_surface
         surface.blit(text_surface, (LOG_PANEL_RECT.left + 5, start_y + i * line_height)) 
 
 class SelectionHighlight:
@@ -810,24 +840,10 @@ class SelectionHighlight:
         self.grid_x = 0
         self.grid_y = 0
         self.color = (255, 255, 255, 128)  # Semi-transparent white
+        self.highlight_surface = self.create_highlight()
         
-    def update_position(self, mouse_pos):
-        # Convert screen coordinates to grid coordinates
-        screen_center_x = MAIN_AREA_WIDTH // 2
-        screen_center_y = SCREEN_HEIGHT // 2
-        
-        # Calculate relative position from screen center
-        rel_x = mouse_pos[0] - screen_center_x
-        rel_y = mouse_pos[1] - screen_center_y
-        
-        # Convert to isometric grid coordinates using same formula as Entity class
-        self.grid_x = round((rel_x / TILE_WIDTH + rel_y / TILE_HEIGHT) / 2)
-        self.grid_y = round((rel_y / TILE_HEIGHT - rel_x / TILE_WIDTH) / 2)
-        
-    def draw(self, surface):
-        if selected_grid_pos is None:
-            return
-            
+    def create_highlight(self):
+        """Build the highlight diamond once - only its position changes between frames"""
         # Create surface for the highlight
         highlight_surface = pygame.Surface((TILE_WIDTH * 2, TILE_WIDTH * 2), pygame.SRCALPHA)
         
@@ -846,6 +862,26 @@ class SelectionHighlight:
         # Draw semi-transparent highlight
         pygame.draw.polygon(highlight_surface, self.color, points)
         pygame.draw.polygon(highlight_surface, (255, 255, 255), points, 2)  # White border
+        return highlight_surface
+        
+    def update_position(self, mouse_pos):
+        # Convert screen coordinates to grid coordinates
+        screen_center_x = MAIN_AREA_WIDTH // 2
+        screen_center_y = SCREEN_HEIGHT // 2
+        
+        # Calculate relative position from screen center
+        rel_x = mouse_pos[0] - screen_center_x
+        rel_y = mouse_pos[1] - screen_center_y
+        
+        # Convert to isometric grid coordinates using same formula as Entity class
+        self.grid_x = round((rel_x / TILE_WIDTH + rel_y / TILE_HEIGHT) / 2)
+        self.grid_y = round((rel_y / TILE_HEIGHT - rel_x / TILE_WIDTH) / 2)
+        
+    def draw(self, surface):
+        if selected_grid_pos is None:
+            return
+            
+        highlight_surface = self.highlight_surface
         
         # Calculate screen position using same conversion as Entity class
         iso_x, iso_y = to_isometric(self.grid_x, self.grid_y)
@@ -878,14 +914,7 @@ class SidebarComponent:
                     if self.type == "SUPPLIER":
                         add_supplier_to_network(selected_grid_pos[0], selected_grid_pos[1])
                     else:
-                        consumer_type = None
-                        if self.type == "INDUCTIVE_CONSUMER":
-                            consumer_type = CONSUMER_TYPE_INDUCTIVE
-                        elif self.type == "CAPACITIVE_CONSUMER":
-                            consumer_type = CONSUMER_TYPE_CAPACITIVE
-                        elif self.type == "RESISTIVE_CONSUMER":
-                            consumer_type = CONSUMER_TYPE_RESISTIVE
-                        
+                        consumer_type = SIDEBAR_CONSUMER_TYPES.get(self.type)
                         if consumer_type:
                             add_consumer_to_network(selected_grid_pos[0], selected_grid_pos[1], consumer_type)
                     
@@ -917,14 +946,12 @@ class SidebarComponent:
         pygame.draw.polygon(surface, darken_color(self.config["icon_color"], 0.7), points, 2)
         
         # Draw label
-        font = pygame.font.SysFont("Arial", 14, bold=True)
-        label_surface = font.render(self.config["label"], True, WHITE)
+        label_surface = label_font.render(self.config["label"], True, WHITE)
         label_rect = label_surface.get_rect(center=(center_x, center_y))
         surface.blit(label_surface, label_rect)
         
         # Draw description
-        desc_font = pygame.font.SysFont("Arial", 16)
-        desc_surface = desc_font.render(self.config["description"], True, SIDEBAR_TEXT)
+        desc_surface = body_font.render(self.config["description"], True, SIDEBAR_TEXT)
         desc_x = center_x + preview_size + 10
         desc_y = self.rect.centery - desc_surface.get_height() // 2
         surface.blit(desc_surface, (desc_x, desc_y))
@@ -968,8 +995,7 @@ class Sidebar:
         surface.blit(shadow_surface, (self.rect.x - SIDEBAR_SHADOW_WIDTH, 0))
         
         # Draw title
-        font = pygame.font.SysFont("Arial", 24, bold=True)
-        title_surface = font.render("Components", True, SIDEBAR_TEXT)
+        title_surface = sidebar_title_font.render("Components", True, SIDEBAR_TEXT)
         title_x = self.rect.x + (SIDEBAR_WIDTH - title_surface.get_width()) // 2
         surface.blit(title_surface, (title_x, (SIDEBAR_TITLE_HEIGHT - title_surface.get_height()) // 2))
         
@@ -978,7 +1004,8 @@ class Sidebar:
             component.draw(surface)
 
 def main():
-    global screen, log_font, entity_font, menu_font, selected_grid_pos, selected_component_type, config_manager
+    global screen, log_font, log_max_chars, entity_font, menu_font, selected_grid_pos, selected_component_type, config_manager
+    global menu_title_font, button_font, label_font, body_font, sidebar_title_font
     
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -987,8 +1014,15 @@ def main():
     
     # Initialize fonts
     log_font = pygame.font.SysFont("Arial", 14)
+    log_max_chars = SCREEN_WIDTH // (log_font.size("A")[0] or 8) - 3
     entity_font = pygame.font.SysFont("Arial", ENTITY_FONT_SIZE, bold=True)
     menu_font = pygame.font.SysFont("Arial", MENU_ITEM_SIZE)
+    # Shared fonts - SysFont does a system font lookup, so never create them per frame
+    menu_title_font = pygame.font.SysFont("Arial", MENU_TITLE_SIZE)
+    button_font = pygame.font.SysFont("Arial", BUTTON_SIZE - 10)
+    label_font = pygame.font.SysFont("Arial", 14, bold=True)
+    body_font = pygame.font.SysFont("Arial", 16)
+    sidebar_title_font = pygame.font.SysFont("Arial", 24, bold=True)
     
     # Initialize configuration manager
     config_manager = ConfigurationManager('power_grid.db')
@@ -1071,11 +1105,8 @@ def main():
                         mouse_pos = event.pos
                         if mouse_pos[0] < MAIN_AREA_WIDTH:  # Only if clicking in main area
                             # Check if clicking on existing entity for connection
-                            entity_clicked = None
-                            for entity in pygame_entities:
-                                if entity.rect.collidepoint(mouse_pos):
-                                    entity_clicked = entity
-                                    break
+                            hit_index = pygame.Rect(mouse_pos, (1, 1)).collidelist([e.rect for e in pygame_entities])
+                            entity_clicked = pygame_entities[hit_index] if hit_index != -1 else None
                             
                             if entity_clicked and (keys_pressed[pygame.K_LSHIFT] or keys_pressed[pygame.K_RSHIFT]):
                                 if entity_clicked.entity_type == "consumer":
@@ -1118,10 +1149,11 @@ def main():
                 # Draw everything
                 screen.fill(BLACK)
                 
-                # Draw all entities
+                # Draw all connections underneath, then every entity in one batched blit
                 for entity in pygame_entities:
                     entity.draw_connections(screen)
-                    entity.draw(screen)
+                screen.blits([item for entity in pygame_entities for item in entity.blit_items()],
+                             doreturn=False)
                 
                 # Draw temporary connection line
                 if connecting_consumer and temp_connection_line_end: